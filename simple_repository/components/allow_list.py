@@ -7,9 +7,10 @@
 
 from __future__ import annotations
 
-import dataclasses
 import typing
 
+import packaging.utils
+
 from . import core
 from .. import errors, model
 from .._typing_compat import override
@@ -18,7 +19,12 @@ from .._typing_compat import override
 class AllowListRepository(core.RepositoryContainer):
     def __init__(self, source: core.SimpleRepository, allow_list: typing.Tuple[str, ...]) -> None:
         super().__init__(source)
-        self._allow_list = allow_list
+        # Normalize the allowed names once, such that they can be compared
+        # directly with the normalized names of the projects. A frozenset
+        # keeps the membership tests constant time for large allow lists.
+        self._allow_list = frozenset(
+            packaging.utils.canonicalize_name(name) for name in allow_list
+        )
 
     @override
     async def get_project_list(
@@ -30,7 +36,7 @@ class AllowListRepository(core.RepositoryContainer):
         projects = frozenset(
             elem for elem in project_list.projects if elem.normalized_name in self._allow_list
         )
-        return dataclasses.replace(project_list, projects=projects)
+        return model.ProjectList(meta=project_list.meta, projects=projects)
 
     @override
     async def get_project_page(
@@ -39,7 +45,7 @@ class AllowListRepository(core.RepositoryContainer):
         *,
         request_context: model.RequestContext = model.RequestContext.DEFAULT,
     ) -> model.ProjectDetail:
-        if project_name not in self._allow_list:
+        if packaging.utils.canonicalize_name(project_name) not in self._allow_list:
             raise errors.PackageNotFoundError(project_name)
         return await super().get_project_page(project_name, request_context=request_context)
 
@@ -51,7 +57,7 @@ class AllowListRepository(core.RepositoryContainer):
         *,
         request_context: model.RequestContext = model.RequestContext.DEFAULT,
     ) -> model.Resource:
-        if project_name not in self._allow_list:
+        if packaging.utils.canonicalize_name(project_name) not in self._allow_list:
             raise errors.ResourceUnavailable(resource_name)
         return await super().get_resource(
             project_name, resource_name, request_context=request_context,
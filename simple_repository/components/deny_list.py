@@ -7,9 +7,10 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
 import typing
 
+import packaging.utils
+
 from . import core
 from .. import errors, model
 from .._typing_compat import override
@@ -18,7 +19,11 @@ from .._typing_compat import override
 class DenyListRepository(core.RepositoryContainer):
     def __init__(self, source: core.SimpleRepository, deny_list: typing.Tuple[str, ...]) -> None:
         super().__init__(source)
-        self._deny_list = deny_list
+        # Normalize the denied names once, such that they can be compared
+        # directly with the normalized names of the projects.
+        self._deny_list = frozenset(
+            packaging.utils.canonicalize_name(name) for name in deny_list
+        )
 
     @override
     async def get_project_list(
@@ -30,7 +35,7 @@ class DenyListRepository(core.RepositoryContainer):
         projects = frozenset(
             elem for elem in project_list.projects if elem.normalized_name not in self._deny_list
         )
-        return replace(project_list, projects=projects)
+        return model.ProjectList(meta=project_list.meta, projects=projects)
 
     @override
     async def get_project_page(
@@ -39,7 +44,7 @@ class DenyListRepository(core.RepositoryContainer):
         *,
         request_context: model.RequestContext = model.RequestContext.DEFAULT,
     ) -> model.ProjectDetail:
-        if project_name in self._deny_list:
+        if packaging.utils.canonicalize_name(project_name) in self._deny_list:
             raise errors.PackageNotFoundError(project_name)
         return await super().get_project_page(project_name, request_context=request_context)
 
@@ -51,7 +56,7 @@ class DenyListRepository(core.RepositoryContainer):
         *,
         request_context: model.RequestContext = model.RequestContext.DEFAULT,
     ) -> model.Resource:
-        if project_name in self._deny_list:
+        if packaging.utils.canonicalize_name(project_name) in self._deny_list:
             raise errors.ResourceUnavailable(resource_name)
         return await super().get_resource(
             project_name, resource_name, request_context=request_context,
@@ -22,6 +22,9 @@ from .. import errors, model, utils
 from .._typing_compat import override
 
 metadata_regex = re.compile(r'^(.*)-.*\.dist-info/METADATA$')
+# PEP-427: {distribution}-{version}(-{build tag})?-{python tag}-{abi tag}-{platform tag}.whl
+# Only the distribution and version are required, to tolerate non-compliant filenames.
+wheel_filename_regex = re.compile(r'^([^-]+)-([^-]+)(?:-.*)?\.whl$')
 
 
 class MetadataInjectorRepository(core.RepositoryContainer):
@@ -111,12 +114,13 @@ class MetadataInjectorRepository(core.RepositoryContainer):
         return metadata_resource
 
     def _get_metadata_from_wheel(self, package_path: pathlib.Path) -> str:
-        package_tokens = package_path.name.split('-')
-        if len(package_tokens) < 2:
+        filename = package_path.name
+        filename_match = wheel_filename_regex.match(filename)
+        if not filename_match:
             raise ValueError(
-                f"Filename {package_path.name} is not normalized according to PEP-427",
+                f"Filename {filename} is not normalized according to PEP-427",
             )
-        distribution = packaging.utils.canonicalize_name(package_tokens[0])
+        distribution = packaging.utils.canonicalize_name(filename_match.group(1))
         # Package consumer, when extracting metadata, should tolerate small differences
         # respecting what is strictly described in PEP-427, for reference see:
         # https://packaging.python.org/en/latest/specifications/binary-distribution-format/
@@ -30,7 +30,7 @@ class NewReleasesRemover(core.RepositoryContainer):
         whitelist: typing.Tuple[str, ...] = (),
     ) -> None:
         self._quarantine_time = quarantine_time
-        self._whitelist = whitelist
+        self._whitelist = frozenset(whitelist)
         super().__init__(source)
 
     @override
@@ -62,7 +62,6 @@ class ResourceCacheRepository(core.RepositoryContainer):
         """
         project_dir = (self._cache_path / project_name).resolve()
         resource_path = (project_dir / resource_name).resolve()
-        resource_info_path = resource_path.with_suffix(resource_path.suffix + ".info")
 
         # Ensures that the requested resource is contained
         # in the cache directory to avoid path traversal.
@@ -72,10 +71,12 @@ class ResourceCacheRepository(core.RepositoryContainer):
         ):
             raise ValueError(f"{resource_path} is not contained in {self._cache_path}")
 
+        resource_info_path = resource_path.with_suffix(resource_path.suffix + ".info")
+
         project_dir.mkdir(exist_ok=True)
 
         # Require the resource upstream, if available use the cached etag.
-        cache_etag = resource_info_path.read_text() if resource_info_path.is_file() else None
+        cache_etag = self._read_cached_etag(resource_info_path)
         if cache_etag:
             context = {
                 **request_context.context,
@@ -166,6 +167,14 @@ class ResourceCacheRepository(core.RepositoryContainer):
             raise ValueError(f"Unknown resource type: {type(resource)}.")
         resource_info_path.write_text(upstream_etag)
 
+    def _read_cached_etag(self, resource_info_path: pathlib.Path) -> typing.Optional[str]:
+        # Read the file directly rather than checking for its existence first,
+        # so that a cache lookup costs a single filesystem round-trip.
+        try:
+            return resource_info_path.read_text()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
     def _cached_resource(
         self,
         resource_path: pathlib.Path,
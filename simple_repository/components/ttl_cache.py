@@ -0,0 +1,119 @@
+# Copyright (C) 2023, CERN
+# This software is distributed under the terms of the MIT
+# licence, copied verbatim in the file "LICENSE".
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from datetime import timedelta
+import time
+import typing
+
+from . import core
+from .. import errors, model
+from .._typing_compat import override
+
+
+class TTLCacheRepository(core.RepositoryContainer):
+    """
+    An in-memory cache of the project list and project pages of the source
+    repository. Each entry is served from memory until its time-to-live has
+    elapsed, after which it is retrieved again from the source. Projects not
+    found in the source are cached too. At most ``max_size`` project pages are
+    kept, evicting the least recently used ones first. Concurrent requests for
+    a project page which is not cached share a single request to the source,
+    made with the ``request_context`` of the first of those requests.
+
+    Resources are not cached by this component, see
+    :class:`ResourceCacheRepository` for that purpose.
+    """
+    def __init__(
+        self,
+        source: core.SimpleRepository,
+        ttl: timedelta = timedelta(seconds=60),
+        max_size: int = 2048,
+    ) -> None:
+        super().__init__(source)
+        self._ttl = ttl.total_seconds()
+        self._max_size = max_size
+        # Maps the project name to the expiry time and the project page
+        # (None if the project was not found).
+        self._project_pages: collections.OrderedDict[
+            str,
+            typing.Tuple[float, typing.Optional[model.ProjectDetail]],
+        ] = collections.OrderedDict()
+        # The in-flight retrievals of project pages from the source.
+        self._pending_project_pages: typing.Dict[
+            str,
+            asyncio.Future[typing.Optional[model.ProjectDetail]],
+        ] = {}
+        self._project_list: typing.Optional[typing.Tuple[float, model.ProjectList]] = None
+
+    @override
+    async def get_project_page(
+        self,
+        project_name: str,
+        *,
+        request_context: model.RequestContext = model.RequestContext.DEFAULT,
+    ) -> model.ProjectDetail:
+        cached = self._project_pages.get(project_name)
+        if cached is not None and cached[0] > time.monotonic():
+            self._project_pages.move_to_end(project_name)
+            project_page = cached[1]
+        else:
+            fetch = self._pending_project_pages.get(project_name)
+            if fetch is None:
+                fetch = asyncio.ensure_future(
+                    self._fetch_project_page(project_name, request_context),
+                )
+                # Retrieve the exception even if all the callers have been
+                # cancelled, such that asyncio does not log it as never retrieved.
+                fetch.add_done_callback(lambda f: f.cancelled() or f.exception())
+                self._pending_project_pages[project_name] = fetch
+            # Shielded, such that a cancelled caller does not cancel the
+            # retrieval awaited by the other callers.
+            project_page = await asyncio.shield(fetch)
+
+        if project_page is None:
+            raise errors.PackageNotFoundError(project_name)
+        return project_page
+
+    async def _fetch_project_page(
+        self,
+        project_name: str,
+        request_context: model.RequestContext,
+    ) -> typing.Optional[model.ProjectDetail]:
+        try:
+            try:
+                project_page: typing.Optional[model.ProjectDetail] = (
+                    await super().get_project_page(
+                        project_name,
+                        request_context=request_context,
+                    )
+                )
+            except errors.PackageNotFoundError:
+                project_page = None
+            self._project_pages[project_name] = (time.monotonic() + self._ttl, project_page)
+            self._project_pages.move_to_end(project_name)
+            while len(self._project_pages) > self._max_size:
+                self._project_pages.popitem(last=False)
+            return project_page
+        finally:
+            del self._pending_project_pages[project_name]
+
+    @override
+    async def get_project_list(
+        self,
+        *,
+        request_context: model.RequestContext = model.RequestContext.DEFAULT,
+    ) -> model.ProjectList:
+        now = time.monotonic()
+        if self._project_list is not None and self._project_list[0] > now:
+            return self._project_list[1]
+        project_list = await super().get_project_list(request_context=request_context)
+        self._project_list = (now + self._ttl, project_list)
+        return project_list
@@ -11,6 +11,7 @@ import dataclasses
 import fnmatch
 import html
 import pathlib
+import re
 import typing
 
 import aiosqlite
@@ -95,7 +96,7 @@ class GlobYankProvider(YankProvider):
     ) -> None:
         self._yank_config: typing.Dict[
             str,
-            typing.Tuple[str, str],
+            typing.Tuple[re.Pattern[str], str],
         ] = self._load_config_json(yank_config_file)
 
     async def yanked_versions(self, project_page: model.ProjectDetail) -> typing.Dict[str, str]:
@@ -109,7 +110,7 @@ class GlobYankProvider(YankProvider):
             pattern, reason = value
             yanked_files = {
                 file.filename: reason for file in project_page.files
-                if fnmatch.fnmatch(file.filename, pattern)
+                if pattern.match(file.filename)
             }
 
         return yanked_files
@@ -117,10 +118,10 @@ class GlobYankProvider(YankProvider):
     def _load_config_json(
         self,
         json_file: pathlib.Path,
-    ) -> typing.Dict[str, typing.Tuple[str, str]]:
+    ) -> typing.Dict[str, typing.Tuple[re.Pattern[str], str]]:
         json_config = utils.load_config_json(json_file)
 
-        config_dict: typing.Dict[str, typing.Tuple[str, str]] = {}
+        config_dict: typing.Dict[str, typing.Tuple[re.Pattern[str], str]] = {}
         for key, value in json_config.items():
             if (
                 not isinstance(key, str) or
@@ -133,7 +134,11 @@ class GlobYankProvider(YankProvider):
                     ' contain a dictionary mapping a project name to a tuple'
                     ' containing a glob pattern and a yank reason.',
                 )
-            config_dict[packaging.utils.canonicalize_name(key)] = (value[0], value[1])
+            # Translate the glob patterns once, rather than on each request.
+            config_dict[packaging.utils.canonicalize_name(key)] = (
+                re.compile(fnmatch.translate(value[0])),
+                value[1],
+            )
 
         return config_dict
 
@@ -191,6 +196,7 @@ class YankRepository(core.RepositoryContainer):
         yanked_versions: typing.Dict[str, str],
         yanked_files: typing.Dict[str, str],
     ) -> model.ProjectDetail:
+        project_name = packaging.utils.canonicalize_name(project_page.name)
         files = []
         for file in project_page.files:
             if file.yanked:
@@ -204,7 +210,7 @@ class YankRepository(core.RepositoryContainer):
                     try:
                         version = _packaging.extract_package_version(
                             filename=file.filename,
-                            project_name=packaging.utils.canonicalize_name(project_page.name),
+                            project_name=project_name,
                         )
                     except ValueError:
                         pass
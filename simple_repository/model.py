@@ -34,6 +34,7 @@ from __future__ import annotations
 import dataclasses
 from datetime import datetime
 import pathlib
+import sys
 import typing
 
 import packaging.utils
@@ -46,8 +47,23 @@ if typing.TYPE_CHECKING:
     from . import SimpleRepository
 
 
-@dataclasses.dataclass(frozen=True)
-class File:
+# The models are instantiated in large numbers (e.g. one File per distribution),
+# where supported, use slots to reduce their memory footprint.
+_dataclass_slots: typing.Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+class _CachedHash:
+    # Holds the hash cached by a model, as a slot rather than as a dataclass
+    # field, such that it is not part of fields(), asdict(), astuple() or the
+    # model's __init__.
+    __slots__ = ("_hash",)
+    _hash: int
+
+
+@dataclasses.dataclass(frozen=True, **_dataclass_slots)
+class File(_CachedHash):
     """
     Simple representation of a distribution file.
     Defined in PEP-691: https://peps.python.org/pep-0691/
@@ -103,9 +119,23 @@ class File:
     def __post_init__(self) -> None:
         if self.yanked == "":
             raise ValueError("The yanked attribute may not be an empty string")
+        # Files are frequently deduplicated using sets and dicts, hence their
+        # hash is computed once, from the fields which identify a file.
+        object.__setattr__(self, "_hash", hash((self.filename, self.url)))
 
+    def __hash__(self) -> int:
+        return self._hash
 
-@dataclasses.dataclass(frozen=True)
+    # String hashes are randomized per process, hence the cached hash
+    # must not be pickled, but computed again when unpickling.
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return (
+            type(self),
+            tuple(getattr(self, field.name) for field in dataclasses.fields(self) if field.init),
+        )
+
+
+@dataclasses.dataclass(frozen=True, **_dataclass_slots)
 class Meta:
     """Responses metadata defined in PEP-629:
     https://peps.python.org/pep-0629/
@@ -113,7 +143,7 @@ class Meta:
     api_version: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_dataclass_slots)
 class ProjectDetail:
     """Model of a project page as described in PEP-691"""
     meta: Meta
@@ -147,16 +177,25 @@ class ProjectDetail:
         return packaging.utils.canonicalize_name(self.name)
 
 
-@dataclasses.dataclass(frozen=True)
-class ProjectListElement:
+@dataclasses.dataclass(frozen=True, **_dataclass_slots)
+class ProjectListElement(_CachedHash):
     name: str  # not necessarily normalized.
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash(self.name))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return (type(self), (self.name,))
+
     @property
     def normalized_name(self) -> str:
         return packaging.utils.canonicalize_name(self.name)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_dataclass_slots)
 class ProjectList:
     """Model of the project list as described in PEP-691"""
     meta: Meta
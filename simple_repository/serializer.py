@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import functools
 import html
 import json
 import typing
@@ -17,6 +18,25 @@ import packaging.version
 from . import content_negotiation, model
 from ._typing_compat import Protocol
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps_project_page(obj: typing.Any) -> str:
+    # Project pages may reference thousands of files, orjson is used
+    # when available as it serializes them considerably faster.
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError. orjson rejects strings
+            # that are not valid UTF-8, such as the lone surrogates produced
+            # for undecodable file names on disk, which json handles.
+            pass
+    return json.dumps(obj)
+
 
 class Serializer(Protocol):
     def serialize_project_page(self, page: model.ProjectDetail) -> str:
@@ -43,7 +63,7 @@ class SerializerJsonV1(Serializer):
         }
         if page.versions is not None:
             project_page_dict["versions"] = list(page.versions)
-        return json.dumps(project_page_dict)
+        return _dumps_project_page(project_page_dict)
 
     def serialize_project_list(self, page: model.ProjectList) -> str:
         list_dict = {
@@ -105,19 +125,33 @@ class SerializerHtmlV1(Serializer):
     SIMPLE_INDEX_PROJECT_LINK = '<a href="{href}">{project}</a><br/>\n'
     SIMPLE_INDEX_FOOTER = "</body>\n</html>"
 
+    def __init__(self) -> None:
+        # Files are immutable and the same files are rendered on every request
+        # of a project page, so their serialization is memoized. The cache
+        # belongs to the instance rather than to the method, so serializers
+        # are not kept alive by a class-level cache. Note that the cache
+        # assumes that the hashes and dist_info_metadata dicts of a File are
+        # never mutated after its construction, which is not enforced.
+        self._serialize_file_cached: typing.Callable[[model.File], str] = (
+            functools.lru_cache(maxsize=16384)(self._render_file)
+        )
+
     def serialize_project_page(self, page: model.ProjectDetail) -> str:
-        project_page_html = [
-            self.SIMPLE_PROJECT_HEADER.format(
-                api_version=page.meta.api_version,
-                project_name=page.name,
-            ),
-        ]
+        return "".join(self.iter_serialize_project_page(page))
 
+    def iter_serialize_project_page(self, page: model.ProjectDetail) -> typing.Iterator[str]:
+        """
+        Serialize the project page in chunks (the header, one chunk per file,
+        and the footer), allowing large pages to be streamed to a client
+        without building the whole page in memory first.
+        """
+        yield self.SIMPLE_PROJECT_HEADER.format(
+            api_version=page.meta.api_version,
+            project_name=page.name,
+        )
         for file in page.files:
-            project_page_html.append(self._serialize_file(file))
-
-        project_page_html.append(self.SIMPLE_PROJECT_FOOTER)
-        return "".join(project_page_html)
+            yield self._serialize_file(file)
+        yield self.SIMPLE_PROJECT_FOOTER
 
     def serialize_project_list(self, page: model.ProjectList) -> str:
         project_list_html = [
@@ -137,20 +171,23 @@ class SerializerHtmlV1(Serializer):
         return "".join(project_list_html)
 
     def _serialize_file(self, file: model.File) -> str:
+        return self._serialize_file_cached(file)
+
+    def _render_file(self, file: model.File) -> str:
+        # Each optional attribute is rendered as a fragment with a leading
+        # space (or as an empty string when absent), such that the attributes
+        # can be combined in a single f-string.
         url = file.url
-        attributes = []
         if file.hashes:
             hash_fun = "sha256" if "sha256" in file.hashes else next(iter(file.hashes))
             hash_value = file.hashes[hash_fun]
-            fragment = f"{hash_fun}={hash_value}"
-            url = f"{url}#{fragment}"
-
-        attributes.append(f'href="{url}"')
+            url = f"{url}#{hash_fun}={hash_value}"
 
+        requires_python = ""
         if file.requires_python:
             # From PEP 503: In the attribute value, < and > have to be HTML
             # encoded as &lt; and &gt;, respectively.
-            attributes.append(f'data-requires-python="{html.escape(file.requires_python)}"')
+            requires_python = f' data-requires-python="{html.escape(file.requires_python)}"'
 
         # From PEP 658: The repository SHOULD provide the hash of the Core Metadata file as the
         # data-dist-info-metadata attribute’s value using the syntax <hashname>=<hashvalue>,
@@ -161,46 +198,50 @@ class SerializerHtmlV1(Serializer):
         # From PEP 714: The PEP 658 metadata, when used in the HTML representation of the Simple
         # API, MUST be emitted using the attribute name data-core-metadata, with the supported
         # values remaining the same.
+        core_metadata = ""
         if file.dist_info_metadata:
             if file.dist_info_metadata is True:
-                attributes.append('data-core-metadata="true"')
+                core_metadata = ' data-core-metadata="true"'
             else:
                 hash_fun = (
                     "sha256" if "sha256" in file.dist_info_metadata
                     else next(iter(file.dist_info_metadata))
                 )
                 hash_value = file.dist_info_metadata[hash_fun]
-                attributes.append(f'data-core-metadata="{hash_fun}={hash_value}"')
+                core_metadata = f' data-core-metadata="{hash_fun}={hash_value}"'
 
         # From PEP 592: The value of the data-yanked attribute, if present, is an arbitrary
         # string that represents the reason for why the file has been yanked.
         # According to PEP 691, if the reason is not specified, the value of the yanked key
         # is set to True and never to an empty string.
+        yanked = ""
         if file.yanked:
             if file.yanked is True:
-                attributes.append('data-yanked=""')
+                yanked = ' data-yanked=""'
             else:
-                attributes.append(f'data-yanked="{file.yanked}"')
+                yanked = f' data-yanked="{file.yanked}"'
 
         # From PEP 503: A repository MAY include a data-gpg-sig attribute on a file link with
         # a value of either true or false to indicate whether or not there is a GPG signature.
+        gpg_sig = ""
         if file.gpg_sig:
-            attributes.append('data-gpg-sig="true"')
+            gpg_sig = ' data-gpg-sig="true"'
         elif file.gpg_sig is False:
-            attributes.append('data-gpg-sig="false"')
-
-        attributes_string = " ".join(attributes)
+            gpg_sig = ' data-gpg-sig="false"'
 
         return self.SIMPLE_PROJECT_LINK.format(
             file_name=file.filename,
-            attributes=attributes_string,
+            attributes=f'href="{url}"{requires_python}{core_metadata}{yanked}{gpg_sig}',
         )
 
 
+# Both HTML formats share a serializer, and therefore its cache of files.
+_serializer_html_v1 = SerializerHtmlV1()
+
 serializers: typing.Dict[content_negotiation.Format, Serializer] = {
     content_negotiation.Format.JSON_V1: SerializerJsonV1(),
-    content_negotiation.Format.HTML_V1: SerializerHtmlV1(),
-    content_negotiation.Format.HTML_LEGACY: SerializerHtmlV1(),
+    content_negotiation.Format.HTML_V1: _serializer_html_v1,
+    content_negotiation.Format.HTML_LEGACY: _serializer_html_v1,
 }
 
 
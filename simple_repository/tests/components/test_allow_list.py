@@ -35,6 +35,21 @@ async def test__get_project_list(repository: AllowListRepository) -> None:
     ])
 
 
+@pytest.mark.asyncio
+async def test__get_project_list__not_normalized_allow_list(
+    source_repository: FakeRepository,
+) -> None:
+    repository = AllowListRepository(
+        source=source_repository,
+        allow_list=("Project1", "project_2"),
+    )
+    project_list = await repository.get_project_list()
+    assert project_list.projects == frozenset([
+        model.ProjectListElement("project1"),
+    ])
+    assert repository._allow_list == {"project1", "project-2"}
+
+
 @pytest.mark.asyncio
 async def test__get_project_page__allow_listed(
     repository: AllowListRepository,
@@ -44,6 +59,16 @@ async def test__get_project_page__allow_listed(
     assert project_page == source_repository.project_pages["project1"]
 
 
+@pytest.mark.asyncio
+async def test__get_project_page__allow_listed__not_normalized(
+    repository: AllowListRepository,
+    source_repository: FakeRepository,
+) -> None:
+    source_repository.project_pages["Project1"] = source_repository.project_pages["project1"]
+    project_page = await repository.get_project_page("Project1")
+    assert project_page == source_repository.project_pages["project1"]
+
+
 @pytest.mark.asyncio
 async def test__get_project_page__not_allow_listed(repository: AllowListRepository) -> None:
     with pytest.raises(errors.PackageNotFoundError):
@@ -57,6 +82,15 @@ async def test__get_resource__allow_listed(repository: AllowListRepository) -> N
     assert resource.url == "content1"
 
 
+@pytest.mark.asyncio
+async def test__get_resource__allow_listed__not_normalized(
+    repository: AllowListRepository,
+) -> None:
+    resource = await repository.get_resource("PROJECT1", "project1-1.0.tar.gz")
+    assert isinstance(resource, model.HttpResource)
+    assert resource.url == "content1"
+
+
 @pytest.mark.asyncio
 async def test__get_resource__not_allow_listed(repository: AllowListRepository) -> None:
     with pytest.raises(errors.ResourceUnavailable):
@@ -22,7 +22,7 @@ if typing.TYPE_CHECKING:
 def repository(source_repository: FakeRepository) -> DenyListRepository:
     return DenyListRepository(
         source=source_repository,
-        deny_list=("project3"),
+        deny_list=("project3",),
     )
 
 
@@ -35,6 +35,22 @@ async def test__get_project_list(repository: DenyListRepository) -> None:
     ])
 
 
+@pytest.mark.asyncio
+async def test__get_project_list__not_normalized_deny_list(
+    source_repository: FakeRepository,
+) -> None:
+    repository = DenyListRepository(
+        source=source_repository,
+        deny_list=("Project3", "project.4"),
+    )
+    project_list = await repository.get_project_list()
+    assert project_list.projects == frozenset([
+        model.ProjectListElement("project1"),
+        model.ProjectListElement("project2"),
+    ])
+    assert repository._deny_list == {"project3", "project-4"}
+
+
 @pytest.mark.asyncio
 async def test__get_project_page__not_deny_listed(
     repository: DenyListRepository,
@@ -50,6 +66,14 @@ async def test__get_project_page__deny_listed(repository: DenyListRepository) ->
         await repository.get_project_page("project3")
 
 
+@pytest.mark.asyncio
+async def test__get_project_page__deny_listed__not_normalized(
+    repository: DenyListRepository,
+) -> None:
+    with pytest.raises(errors.PackageNotFoundError):
+        await repository.get_project_page("Project3")
+
+
 @pytest.mark.asyncio
 async def test__get_resource__not_deny_listed(repository: DenyListRepository) -> None:
     resource = await repository.get_resource("project1", "project1-1.0.tar.gz")
@@ -61,3 +85,11 @@ async def test__get_resource__not_deny_listed(repository: DenyListRepository) ->
 async def test__get_resource__deny_listed(repository: DenyListRepository) -> None:
     with pytest.raises(errors.ResourceUnavailable):
         await repository.get_resource("project3", "project3-1.0.tar.gz")
+
+
+@pytest.mark.asyncio
+async def test__get_resource__deny_listed__not_normalized(
+    repository: DenyListRepository,
+) -> None:
+    with pytest.raises(errors.ResourceUnavailable):
+        await repository.get_resource("PROJECT3", "project3-1.0.tar.gz")
@@ -124,6 +124,11 @@ def test_get_metadata_from_package__not_wheel(repository: MetadataInjectorReposi
         repository._get_metadata_from_package(pathlib.Path('my_package') / 'package.tar.gz')
 
 
+def test_get_metadata_from_package__not_normalized(repository: MetadataInjectorRepository) -> None:
+    with pytest.raises(ValueError, match="is not normalized according to PEP-427"):
+        repository._get_metadata_from_package(pathlib.Path('my_package') / 'package.whl')
+
+
 @pytest.mark.parametrize(
     "namelist", [
         [
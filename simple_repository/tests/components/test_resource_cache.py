@@ -11,6 +11,7 @@ from datetime import datetime
 import logging
 import os
 import pathlib
+import typing
 from unittest import mock
 
 import pytest
@@ -22,6 +23,15 @@ from .fake_repository import FakeRepository
 from .mock_compat import AsyncMock
 
 
+class UnusedHttpClient:
+    """
+    Downloads are mocked in these tests, hence the http client
+    given to the repository must never be used.
+    """
+    def __getattr__(self, name: str) -> typing.NoReturn:
+        raise AssertionError(f"Unexpected use of the http client ({name})")
+
+
 @pytest.fixture
 def repository(tmp_path: pathlib.Path) -> ResourceCacheRepository:
     http_resource = model.HttpResource("url/http-1.0-any.whl")
@@ -40,7 +50,7 @@ def repository(tmp_path: pathlib.Path) -> ResourceCacheRepository:
     return ResourceCacheRepository(
         source=source,
         cache_path=tmp_path,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
     )
 
 
@@ -143,20 +153,52 @@ async def test_get_resource__cache_miss_local_resource(
     assert not (repository._cache_path / "local" / "local-1.0.tar.gz").is_file()
 
 
+@pytest.mark.parametrize(
+    "project_name, resource_name", [
+        ("not-used", "../../../etc/passwords"),
+        ("../../etc", "passwords"),
+        ("..", "passwords"),
+        ("/etc", "passwords"),
+        ("not-used", "/etc/passwords"),
+    ],
+)
 @pytest.mark.asyncio
 async def test_get_resource__path_traversal(
     repository: ResourceCacheRepository,
+    project_name: str,
+    resource_name: str,
+) -> None:
+    context = model.RequestContext(repository)
+    with pytest.raises(
+        ValueError,
+        match="is not contained in",
+    ):
+        await repository.get_resource(
+            project_name=project_name,
+            resource_name=resource_name,
+            request_context=context,
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_resource__symlink_out_of_cache(
+    repository: ResourceCacheRepository,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> None:
+    outside = tmp_path_factory.mktemp("outside")
+    (repository._cache_path / "http").symlink_to(outside, target_is_directory=True)
+
     context = model.RequestContext(repository)
     with pytest.raises(
         ValueError,
         match="is not contained in",
     ):
         await repository.get_resource(
-            project_name="not-used",
-            resource_name="../../../etc/passwords",
+            project_name="http",
+            resource_name="http-1.0-any.whl",
             request_context=context,
         )
+    assert list(outside.iterdir()) == []
 
 
 @pytest.mark.asyncio
@@ -176,7 +218,7 @@ async def test_get_resource__source_unavailable_cache_hit(
     repository = ResourceCacheRepository(
         source=source,
         cache_path=tmp_path,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
     )
 
     resource = await repository.get_resource("project-name", "resource-name")
@@ -201,7 +243,7 @@ async def test_get_resource__source_unavailable_cache_hit__falback_disabled(
     repository = ResourceCacheRepository(
         source=source,
         cache_path=tmp_path,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
         fallback_to_cache=False,
     )
 
@@ -228,7 +270,7 @@ async def test_get_resource__source_unavailable_cache_hit__log(
     repository = ResourceCacheRepository(
         source=source,
         cache_path=tmp_path,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
         logger=mock_logger,
     )
 
@@ -250,7 +292,7 @@ async def test_get_resource__source_unavailable_cache_miss(
     repository = ResourceCacheRepository(
         source=source,
         cache_path=tmp_path,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
     )
 
     with pytest.raises(errors.SourceRepositoryUnavailable):
@@ -293,7 +335,7 @@ async def test_get_resource__no_cache_created_when_to_cache_is_false(
     repository = ResourceCacheRepository(
         source=FakeRepository(resources={"resource-1.0-any.whl": resource}),
         cache_path=tmp_path,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
     )
 
     context = model.RequestContext(repository)
@@ -372,12 +414,24 @@ def test_resource_cache_init(tmp_path: pathlib.Path) -> None:
     repo = ResourceCacheRepository(
         source=AsyncMock(),
         cache_path=symlink,
-        http_client=mock.MagicMock(),
+        http_client=UnusedHttpClient(),
     )
     assert str(symlink) != str(real_repo)
     assert str(repo._cache_path) == str(real_repo)
 
 
+def test_read_cached_etag(repository: ResourceCacheRepository) -> None:
+    cached_info = repository._cache_path / "my_resource.ext.info"
+    assert repository._read_cached_etag(cached_info) is None
+
+    cached_info.write_text("etag")
+    assert repository._read_cached_etag(cached_info) == "etag"
+
+    cached_dir = repository._cache_path / "my_dir.info"
+    cached_dir.mkdir()
+    assert repository._read_cached_etag(cached_dir) is None
+
+
 def test_update_last_access(repository: ResourceCacheRepository) -> None:
     cached_info = repository._cache_path / "my_resource.ext.info"
     cached_info.touch()
@@ -0,0 +1,244 @@
+# Copyright (C) 2023, CERN
+# This software is distributed under the terms of the MIT
+# licence, copied verbatim in the file "LICENSE".
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import gc
+import typing
+from unittest import mock
+
+import pytest
+
+from ... import errors, model
+from ...components import ttl_cache
+from ...components.ttl_cache import TTLCacheRepository
+from .mock_compat import AsyncMock
+
+if typing.TYPE_CHECKING:
+    from .fake_repository import FakeRepository
+
+
+@pytest.fixture
+def repository(source_repository: FakeRepository) -> TTLCacheRepository:
+    return TTLCacheRepository(
+        source=source_repository,
+        ttl=timedelta(seconds=10),
+        max_size=2,
+    )
+
+
+def patch_clock(monotonic: float) -> typing.ContextManager[mock.MagicMock]:
+    # Patch the time module seen by the cache only, the clock of the running
+    # event loop must keep going.
+    return mock.patch.object(
+        ttl_cache,
+        "time",
+        mock.MagicMock(**{"monotonic.return_value": monotonic}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__cached(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    with mock.patch.object(
+        source_repository,
+        "get_project_page",
+        AsyncMock(wraps=source_repository.get_project_page),
+    ) as get_project_page_mock:
+        with patch_clock(100):
+            first = await repository.get_project_page("project1")
+            second = await repository.get_project_page("project1")
+
+    assert first == second == source_repository.project_pages["project1"]
+    get_project_page_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__expired(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    with mock.patch.object(
+        source_repository,
+        "get_project_page",
+        AsyncMock(wraps=source_repository.get_project_page),
+    ) as get_project_page_mock:
+        with patch_clock(100):
+            await repository.get_project_page("project1")
+        with patch_clock(111):
+            await repository.get_project_page("project1")
+
+    assert get_project_page_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__not_found_cached(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    with mock.patch.object(
+        source_repository,
+        "get_project_page",
+        AsyncMock(wraps=source_repository.get_project_page),
+    ) as get_project_page_mock:
+        for _ in range(2):
+            with pytest.raises(errors.PackageNotFoundError):
+                await repository.get_project_page("not-a-project")
+
+    get_project_page_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__max_size(
+    repository: TTLCacheRepository,
+) -> None:
+    await repository.get_project_page("project1")
+    await repository.get_project_page("project2")
+    # Accessing project1 makes project2 the least recently used.
+    await repository.get_project_page("project1")
+    await repository.get_project_page("project3")
+
+    assert list(repository._project_pages) == ["project1", "project3"]
+
+
+@pytest.mark.asyncio
+async def test_get_project_list__cached(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    with mock.patch.object(
+        source_repository,
+        "get_project_list",
+        AsyncMock(wraps=source_repository.get_project_list),
+    ) as get_project_list_mock:
+        with patch_clock(100):
+            first = await repository.get_project_list()
+            second = await repository.get_project_list()
+        with patch_clock(111):
+            third = await repository.get_project_list()
+
+    assert first == second == third == source_repository.project_list
+    assert get_project_list_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_resource__not_cached(
+    repository: TTLCacheRepository,
+) -> None:
+    resource = await repository.get_resource("project1", "project1-1.0.tar.gz")
+    assert isinstance(resource, model.HttpResource)
+    assert resource.url == "content1"
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__concurrent_misses(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    original_get_project_page = source_repository.get_project_page
+
+    async def slow_get_project_page(
+        project_name: str,
+        *,
+        request_context: model.RequestContext = model.RequestContext.DEFAULT,
+    ) -> model.ProjectDetail:
+        await asyncio.sleep(0.01)
+        return await original_get_project_page(project_name, request_context=request_context)
+
+    with mock.patch.object(
+        source_repository,
+        "get_project_page",
+        AsyncMock(side_effect=slow_get_project_page),
+    ) as get_project_page_mock:
+        pages = await asyncio.gather(
+            *(repository.get_project_page("project1") for _ in range(5)),
+        )
+        results = await asyncio.gather(
+            *(repository.get_project_page("not-a-project") for _ in range(5)),
+            return_exceptions=True,
+        )
+
+    assert all(page == source_repository.project_pages["project1"] for page in pages)
+    assert all(isinstance(result, errors.PackageNotFoundError) for result in results)
+    assert get_project_page_mock.await_count == 2
+    assert repository._pending_project_pages == {}
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__cancelled_caller(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    release = asyncio.Event()
+    original_get_project_page = source_repository.get_project_page
+
+    async def blocked_get_project_page(
+        project_name: str,
+        *,
+        request_context: model.RequestContext = model.RequestContext.DEFAULT,
+    ) -> model.ProjectDetail:
+        await release.wait()
+        return await original_get_project_page(project_name, request_context=request_context)
+
+    with mock.patch.object(
+        source_repository,
+        "get_project_page",
+        AsyncMock(side_effect=blocked_get_project_page),
+    ) as get_project_page_mock:
+        first = asyncio.ensure_future(repository.get_project_page("project1"))
+        second = asyncio.ensure_future(repository.get_project_page("project1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        page = await second
+
+    assert first.cancelled()
+    assert page == source_repository.project_pages["project1"]
+    get_project_page_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_project_page__cancelled_callers_source_error(
+    repository: TTLCacheRepository,
+    source_repository: FakeRepository,
+) -> None:
+    release = asyncio.Event()
+
+    async def failing_get_project_page(
+        project_name: str,
+        *,
+        request_context: model.RequestContext = model.RequestContext.DEFAULT,
+    ) -> model.ProjectDetail:
+        await release.wait()
+        raise errors.SourceRepositoryUnavailable()
+
+    loop = asyncio.get_running_loop()
+    unhandled: typing.List[typing.Dict[str, typing.Any]] = []
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+    try:
+        with mock.patch.object(source_repository, "get_project_page", failing_get_project_page):
+            caller = asyncio.ensure_future(repository.get_project_page("project1"))
+            while not repository._pending_project_pages:
+                await asyncio.sleep(0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            # The source only fails once no caller awaits the retrieval anymore.
+            await asyncio.sleep(0)
+            release.set()
+            while repository._pending_project_pages:
+                await asyncio.sleep(0)
+        del caller
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unhandled == []
@@ -7,7 +7,9 @@
 
 from __future__ import annotations
 
+import json
 import pathlib
+import typing
 
 import aiosqlite
 import pytest
@@ -44,6 +46,32 @@ async def test_glob_provider__yanked_files(
     assert {'project-1.0.whl': 'bad'} == res
 
 
+@pytest.mark.parametrize(
+    "pattern, expected", [
+        ("*", {"project-1.0.whl", "project-1.0.tar.gz"}),
+        ("*.tar.gz", {"project-1.0.tar.gz"}),
+        ("project-1.?.whl", {"project-1.0.whl"}),
+        ("project-[12].0.*", {"project-1.0.whl", "project-1.0.tar.gz"}),
+        ("*.WHL", set()),
+        ("project", set()),
+    ],
+)
+@pytest.mark.asyncio
+async def test_glob_provider__yanked_files_patterns(
+    tmp_path: pathlib.Path,
+    project_page: model.ProjectDetail,
+    pattern: str,
+    expected: typing.Set[str],
+) -> None:
+    file = tmp_path / "yank_config.json"
+    file.write_text(data=json.dumps({"project": [pattern, "reason"]}))
+
+    provider = GlobYankProvider(yank_config_file=file)
+
+    res = await provider.yanked_files(project_page)
+    assert res == {filename: "reason" for filename in expected}
+
+
 @pytest.mark.asyncio
 async def test_glob_provider__yanked_versions(
     tmp_path: pathlib.Path,
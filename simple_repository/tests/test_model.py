@@ -7,6 +7,10 @@
 
 from __future__ import annotations
 
+import dataclasses
+import pickle
+import sys
+
 import pytest
 
 from .. import model
@@ -17,6 +21,65 @@ def test_ProjectListElement__normalized_name() -> None:
     assert prj.normalized_name == 'some-name'
 
 
+def test_ProjectListElement__hash() -> None:
+    prj = model.ProjectListElement('some-.name')
+    assert hash(prj) == prj._hash == hash('some-.name')
+    assert len({prj, model.ProjectListElement('some-.name')}) == 1
+
+
+def test_File__hash() -> None:
+    file = model.File("numpy-1.0.tar.gz", "url", {"sha256": "..."})
+    assert hash(file) == file._hash
+    assert hash(file) == hash(model.File("numpy-1.0.tar.gz", "url", {}))
+    assert len({file, model.File("numpy-1.0.tar.gz", "url", {"sha256": "..."})}) == 1
+
+
+def test_File__hash_replace() -> None:
+    file = model.File("numpy-1.0.tar.gz", "url", {})
+    replaced = dataclasses.replace(file, url="other_url")
+    assert replaced._hash == hash(("numpy-1.0.tar.gz", "other_url"))
+
+
+def test_File__asdict_round_trip() -> None:
+    file = model.File("numpy-1.0.tar.gz", "url", {"sha256": "..."}, yanked="reason")
+    assert "_hash" not in {field.name for field in dataclasses.fields(file)}
+    assert model.File(**dataclasses.asdict(file)) == file
+
+
+def test_ProjectListElement__asdict_round_trip() -> None:
+    prj = model.ProjectListElement("numpy")
+    assert dataclasses.asdict(prj) == {"name": "numpy"}
+    assert model.ProjectListElement(**dataclasses.asdict(prj)) == prj
+
+
+def test_File__pickle_recomputes_hash() -> None:
+    file = model.File("numpy-1.0.tar.gz", "url", {"sha256": "..."})
+    object.__setattr__(file, "_hash", 0)
+
+    unpickled = pickle.loads(pickle.dumps(file))
+    assert unpickled == file
+    assert unpickled._hash == hash(("numpy-1.0.tar.gz", "url"))
+
+
+def test_ProjectListElement__pickle_recomputes_hash() -> None:
+    prj = model.ProjectListElement("numpy")
+    object.__setattr__(prj, "_hash", 0)
+
+    unpickled = pickle.loads(pickle.dumps(prj))
+    assert unpickled == prj
+    assert unpickled._hash == hash("numpy")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Slotted dataclasses require Python 3.10")
+def test_models_use_slots() -> None:
+    file = model.File("numpy-1.0.tar.gz", "url", {})
+    assert not hasattr(file, "__dict__")
+    assert not hasattr(model.Meta("1.0"), "__dict__")
+    assert not hasattr(model.ProjectListElement("numpy"), "__dict__")
+    assert not hasattr(model.ProjectDetail(model.Meta("1.0"), "numpy", (file,)), "__dict__")
+    assert not hasattr(model.ProjectList(model.Meta("1.0"), frozenset()), "__dict__")
+
+
 def test_ProjectDetail__normalized_name() -> None:
     project_detail = model.ProjectDetail(
         meta=model.Meta("1.0"),
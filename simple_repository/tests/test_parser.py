@@ -296,6 +296,25 @@ def test_parse_json_project_list() -> None:
     )
 
 
+def test_parse_json_project_list__non_str_api_version() -> None:
+    page = '''
+    {
+        "meta": {
+            "api-version": 1.0
+        },
+        "projects": [
+            {
+                "name": "gym"
+            }
+        ]
+    }'''
+
+    result = parser.parse_json_project_list(page)
+
+    assert result.meta.api_version == 1.0
+    assert result.projects == frozenset([model.ProjectListElement("gym")])
+
+
 def test_parse_html_project_list() -> None:
     page = '''
         <a href="url">gym</a>
@@ -13,7 +13,7 @@ import typing
 
 import pytest
 
-from .. import model, utils
+from .. import content_negotiation, model, serializer, utils
 from ..serializer import SerializerHtmlV1, SerializerJsonV1
 
 
@@ -44,6 +44,48 @@ def test_serialize_file_html() -> None:
     assert serializer._serialize_file(file) == expected
 
 
+def test_serialize_file_html__cached() -> None:
+    serializer = SerializerHtmlV1()
+
+    file = model.File(
+        filename="test.html",
+        url="https://example.com/test.html",
+        hashes={"sha256": "abc123"},
+    )
+    result = serializer._serialize_file(file)
+    assert serializer._serialize_file(file) is result
+    assert serializer._serialize_file(
+        model.File(
+            filename="test.html",
+            url="https://example.com/test.html",
+            hashes={"sha256": "abc123"},
+        ),
+    ) is result
+
+    # A file differing in any field is not served from the cache.
+    assert serializer._serialize_file(
+        model.File(
+            filename="test.html",
+            url="https://example.com/test.html",
+            hashes={"sha256": "def456"},
+        ),
+    ) == '<a href="https://example.com/test.html#sha256=def456">test.html</a><br/>\n'
+
+
+def test_serialize_file_html__cache_per_instance() -> None:
+    file = model.File(filename="test.html", url="https://example.com/test.html", hashes={})
+    first, second = SerializerHtmlV1(), SerializerHtmlV1()
+
+    first._serialize_file(file)
+    assert first._serialize_file_cached.cache_info().currsize == 1
+    assert second._serialize_file_cached.cache_info().currsize == 0
+
+
+def test_serializers__html_formats_share_serializer() -> None:
+    html_v1 = serializer.serializers[content_negotiation.Format.HTML_V1]
+    assert serializer.serializers[content_negotiation.Format.HTML_LEGACY] is html_v1
+
+
 @pytest.mark.parametrize(
     "yank_attr, yank_value",
     [
@@ -153,6 +195,24 @@ def test_serialize_project_page_html() -> None:
     assert serializer.serialize_project_page(project_page) == expected
 
 
+def test_iter_serialize_project_page_html() -> None:
+    project_page = model.ProjectDetail(
+        meta=model.Meta(api_version="1.0"),
+        name="test-project",
+        files=(
+            model.File(filename="test.html", url="https://example.com/test.html", hashes={}),
+            model.File(filename="test.txt", url="test.txt", hashes={}),
+        ),
+    )
+    serializer = SerializerHtmlV1()
+    chunks = list(serializer.iter_serialize_project_page(project_page))
+
+    assert len(chunks) == 4
+    assert chunks[1] == '<a href="https://example.com/test.html">test.html</a><br/>\n'
+    assert chunks[2] == '<a href="test.txt">test.txt</a><br/>\n'
+    assert "".join(chunks) == serializer.serialize_project_page(project_page)
+
+
 def test_serialize_project_list_html() -> None:
     project_list = model.ProjectList(
         meta=model.Meta(api_version="1.0"),
@@ -184,6 +244,18 @@ def test_serialize_project_list_html() -> None:
     assert '<a href="test-project-2/">test-project-2</a><br/>' in a_tags
 
 
+@pytest.fixture(params=["orjson", "json"])
+def json_encoder(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    # Run the JSON serializer tests with and without the optional orjson
+    # dependency, which must produce equivalent documents.
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serializer, "orjson", None)
+    return typing.cast(str, request.param)
+
+
+@pytest.mark.usefixtures("json_encoder")
 def test_serialize_project_page_json() -> None:
     page = model.ProjectDetail(
         model.Meta("1.0"),
@@ -270,6 +342,7 @@ def test_serialize_project_page_json() -> None:
         ),
     ],
 )
+@pytest.mark.usefixtures("json_encoder")
 def test_serialize_project_page_json__v1_1_attrs(
     version: str,
     serialization: str,
@@ -292,6 +365,24 @@ def test_serialize_project_page_json__v1_1_attrs(
     assert json.loads(res)["files"] == json.loads(serialization)
 
 
+@pytest.mark.parametrize(
+    "filename", [
+        "pkg-1.0-\u00e9.whl",
+        # A lone surrogate, as produced for file names that are not valid UTF-8.
+        "pkg-1.0-\udce9.whl",
+    ],
+)
+@pytest.mark.usefixtures("json_encoder")
+def test_serialize_project_page_json__non_ascii(filename: str) -> None:
+    page = model.ProjectDetail(
+        model.Meta("1.0"),
+        "pkg",
+        files=(model.File(filename=filename, url=filename, hashes={}),),
+    )
+    res = SerializerJsonV1().serialize_project_page(page)
+    assert json.loads(res)["files"] == [{"filename": filename, "url": filename, "hashes": {}}]
+
+
 def test_serialize_project_list_json() -> None:
     page = model.ProjectList(
         model.Meta("1.0"),
@@ -26,6 +26,8 @@ from .. import errors, utils
             ("https://example.com/absolute/path", "https://example.com/", "https://example.com/absolute/path"),
             ("//example.com/path", "https://example.org/", "https://example.com/path"),
             ("http://example.com/path", "https://example.org/", "http://example.com/path"),
+            ("HTTPS://example.com/path", "https://example.org/", "HTTPS://example.com/path"),
+            ("file:///path/to/file", "https://example.org/", "file:///path/to/file"),
         ],
 )
 def test_url_absolutizer(url: str, url_base: str, expected_url: str) -> None:
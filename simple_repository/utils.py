@@ -21,6 +21,9 @@ from . import errors
 
 def url_absolutizer(url: str, url_base: str) -> str:
     """Converts a relative url into an absolute one"""
+    if url.startswith(("https://", "http://")):
+        # Fast path for the common case, avoids parsing the whole url.
+        return url
     if not urlparse(url).scheme:
         return urljoin(url_base, url)
     return url